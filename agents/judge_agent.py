@@ -4,21 +4,31 @@ from llama_index.core.agent.workflow import FunctionAgent
 from llama_index.core.llms import LLM
 
 from tools.recording_tools import record_judgment_tool
+from tools.transcript_tools import read_transcript_tool
 
 
-def create_judge_agent(llm: LLM, config: dict, language: str) -> FunctionAgent:
-    """Creates the JudgeAgent."""
+def create_judge_agent(llm: LLM, config: dict, language: str, transcript_store_enabled: bool = False) -> FunctionAgent:
+    """
+    Creates the JudgeAgent.
+    With a transcript store, the judge also gets read_transcript_tool to re-read statements
+    dropped from its bounded chat history.
+    """
     agent_name = config["default_name"]
     system_prompt = config["system_prompt_template"].format(
         agent_name=agent_name,
         language=language
     )
 
+    agent_tools = [record_judgment_tool]
+    if transcript_store_enabled:
+        agent_tools.append(read_transcript_tool)
+        system_prompt += "\n" + config["transcript_tool_prompt"]
+
     return FunctionAgent(
         name=agent_name,
         description=f"The debate judge. Declares a winner and provides reasoning based on arguments. Speaks in {language}.",
         system_prompt=system_prompt,
         llm=llm,
-        tools=[record_judgment_tool],
+        tools=agent_tools,
         can_handoff_to=[],
     )
@@ -4,12 +4,25 @@ from llama_index.core.agent.workflow import FunctionAgent
 from llama_index.core.llms import LLM
 
 from tools.recording_tools import record_statement_tool
+from tools.transcript_tools import read_transcript_tool
 
 
 def create_opponent_agent(
-    llm: LLM, config: dict, name: str, role_description: str, temperament: str, debate_theme: str, language: str, debate_rules: str
+    llm: LLM,
+    config: dict,
+    name: str,
+    role_description: str,
+    temperament: str,
+    debate_theme: str,
+    language: str,
+    debate_rules: str,
+    transcript_store_enabled: bool = False,
 ) -> FunctionAgent:
-    """Creates a generic opponent agent with a specific role, temperament, and debate theme."""
+    """
+    Creates a generic opponent agent with a specific role, temperament, and debate theme.
+    With a transcript store, the opponent also gets read_transcript_tool to re-read statements
+    dropped from its bounded chat history.
+    """
     system_prompt = config["system_prompt_template"].format(
         name=name,
         temperament=temperament,
@@ -19,11 +32,16 @@ def create_opponent_agent(
         language=language
     )
 
+    agent_tools = [record_statement_tool]
+    if transcript_store_enabled:
+        agent_tools.append(read_transcript_tool)
+        system_prompt += "\n" + config["transcript_tool_prompt"]
+
     return FunctionAgent(
         name=name,
         description=f"Opponent {name} arguing about '{debate_theme}'. Stance: {role_description.split(' ')[2]}. Speaks in {language}.", # Extracts stance
         system_prompt=system_prompt,
         llm=llm,
-        tools=[record_statement_tool],
+        tools=agent_tools,
         can_handoff_to=["MediatorAgent"],
     )
\ No newline at end of file
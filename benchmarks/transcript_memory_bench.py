@@ -0,0 +1,155 @@
+"""
+Benchmarks peak RSS against round count, before and after bounding agent memory with the transcript store.
+
+Each run happens in a fresh subprocess so peak RSS is measured independently. A run feeds the
+AgentWorkflow chat memory the messages one debate round adds (mediator turn tracking, status check
+and handoffs, each opponent's record_statement_tool call and result) and reads it back each step,
+as the workflow does. Both runs also keep the novelty state.
+  - before: AgentWorkflow's default ChatMemoryBuffer with Gemini's context window, which keeps every message.
+  - after: RecentChatMemoryBuffer with `transcript_store.memory_token_limit`; statements and ~150 KB
+    of audio per statement are appended to the transcript store instead.
+No LLM or TTS calls are made.
+
+    python benchmarks/transcript_memory_bench.py --rounds 10 --rounds 50 --rounds 200 --rounds 500
+"""
+
+import asyncio
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import click
+from llama_index.core.llms import ChatMessage
+from llama_index.core.memory import ChatMemoryBuffer
+from llama_index.core.memory.chat_memory_buffer import DEFAULT_TOKEN_LIMIT_RATIO
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from events import OpponentStatementEvent  # noqa: E402
+from utils.chat_memory import RecentChatMemoryBuffer  # noqa: E402
+from utils.config_utils import load_config  # noqa: E402
+from utils.novelty import update_novelty_state  # noqa: E402
+from utils.transcript_store import TranscriptStore  # noqa: E402
+
+SPEAKERS = ("OpponentA", "OpponentB")
+AUDIO_BYTES_PER_STATEMENT = 150_000
+WORDS_PER_STATEMENT = 250
+# Context window of the Gemini 2.5 models, which AgentWorkflow's default memory is sized from.
+GEMINI_CONTEXT_WINDOW = 1_048_576
+
+
+def make_statements(rounds: int) -> list[tuple[str, str]]:
+    """Generates reproducible statements from a fixed vocabulary, so later rounds partially repeat."""
+    rng = random.Random(rounds)
+    vocabulary = [f"word{i}" for i in range(3000)]
+    return [
+        (SPEAKERS[turn % 2], " ".join(rng.choices(vocabulary, k=WORDS_PER_STATEMENT)))
+        for turn in range(rounds * len(SPEAKERS))
+    ]
+
+
+def tool_call(name: str, **args) -> ChatMessage:
+    return ChatMessage(role="assistant", content="", additional_kwargs={"tool_calls": [{"name": name, "args": args}]})
+
+
+def tool_result(content: str) -> ChatMessage:
+    return ChatMessage(role="tool", content=content)
+
+
+def statement_turn_messages(speaker: str, statement: str, turn: int) -> list[list[ChatMessage]]:
+    """Returns the messages one opponent turn adds to memory, grouped by agent step."""
+    return [
+        [tool_call("track_turn_tool", speaker_name=speaker),
+         tool_result(f"Tracked turn for {speaker}. They have had {turn} turns. Current speaker is {speaker}.")],
+        [tool_call("check_debate_status_tool"), tool_result(f"ACTION: HANDOFF_TO_SPEAKER:{speaker}")],
+        [tool_call("handoff", to_agent=speaker, reason="Next turn."),
+         tool_result(f"Agent {speaker} is now handling the request due to the following reason: Next turn.")],
+        [tool_call("record_statement_tool", agent_name=speaker, statement=statement),
+         tool_result(f"Statement from {speaker} recorded successfully and spoken.")],
+        [tool_call("handoff", to_agent="MediatorAgent", reason="Statement recorded."),
+         tool_result("Agent MediatorAgent is now handling the request due to the following reason: Statement recorded.")],
+    ]
+
+
+def peak_rss_mb() -> float:
+    """Returns this process's peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+async def run_debate(rounds: int, memory: ChatMemoryBuffer, transcript_store: Optional[TranscriptStore], work_dir: Path) -> int:
+    """Feeds the memory (and the store, if any) a debate of `rounds` rounds. Returns the messages left in memory."""
+    state = {"novelty_config": {"threshold": 0.3, "patience": 2, "ngram_size": 3}}
+    audio_path = work_dir / "audio.mp3"
+    turns = {speaker: 0 for speaker in SPEAKERS}
+    await memory.aput(ChatMessage(role="user", content="Please start and manage the political debate according to the rules."))
+
+    for speaker, statement in make_statements(rounds):
+        turns[speaker] += 1
+        update_novelty_state(state, speaker, statement)
+        for step_messages in statement_turn_messages(speaker, statement, turns[speaker]):
+            await memory.aput_messages(step_messages)
+            await memory.aget()
+
+        # Without a store the statement is only streamed, and its TTS audio goes to a temp file that is deleted.
+        audio_path.write_bytes(random.randbytes(AUDIO_BYTES_PER_STATEMENT))
+        if transcript_store:
+            event = OpponentStatementEvent(speaker_name=speaker, statement=statement)
+            seq = await transcript_store.append_event(speaker, statement, event, debate_turn=turns[speaker])
+            await transcript_store.append_audio(seq, speaker, audio_path, "mp3")
+
+    return len(await memory.aget_all())
+
+
+async def run_before(rounds: int, work_dir: Path) -> int:
+    memory = ChatMemoryBuffer.from_defaults(token_limit=int(GEMINI_CONTEXT_WINDOW * DEFAULT_TOKEN_LIMIT_RATIO))
+    return await run_debate(rounds, memory, None, work_dir)
+
+
+async def run_after(rounds: int, work_dir: Path) -> int:
+    token_limit = load_config("debate_config.yml")["transcript_store"]["memory_token_limit"]
+    memory = RecentChatMemoryBuffer.from_defaults(token_limit=token_limit)
+    transcript_store = await TranscriptStore.open(str(work_dir / "transcript.db"))
+    try:
+        return await run_debate(rounds, memory, transcript_store, work_dir)
+    finally:
+        await transcript_store.close()
+
+
+def measure(mode: str, rounds: int) -> dict:
+    """Runs one benchmark in a subprocess and returns its peak RSS in MB and messages kept in memory."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--worker", mode, "--rounds", str(rounds)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+@click.command(context_settings=dict(help_option_names=['-h', '--help']))
+@click.option("--rounds", "rounds_list", multiple=True, type=int, default=(10, 50, 200, 500), help="Round counts to measure.")
+@click.option("--worker", type=click.Choice(["before", "after"]), default=None, hidden=True)
+def cli_bench(rounds_list: tuple[int, ...], worker: str):
+    """Prints peak RSS and chat messages kept against round count, before and after bounding agent memory."""
+    if worker:
+        run = run_before if worker == "before" else run_after
+        with tempfile.TemporaryDirectory() as work_dir:
+            messages = asyncio.run(run(rounds_list[0], Path(work_dir)))
+        print(json.dumps({"peak_rss_mb": peak_rss_mb(), "messages": messages}))
+        return
+
+    print(f"{'rounds':>8} {'before (MB)':>12} {'messages':>9} {'after (MB)':>11} {'messages':>9}")
+    for rounds in rounds_list:
+        before, after = measure("before", rounds), measure("after", rounds)
+        print(
+            f"{rounds:>8} {before['peak_rss_mb']:>12.1f} {before['messages']:>9}"
+            f" {after['peak_rss_mb']:>11.1f} {after['messages']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    cli_bench()
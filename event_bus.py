@@ -0,0 +1,228 @@
+"""Event bus fanning out the workflow event stream to multiple concurrent subscribers."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_BLOCK = "block"
+OVERFLOW_COALESCE = "coalesce"
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK, OVERFLOW_COALESCE)
+
+
+class EventSubscription:
+    """
+    A bounded queue of (published_at, event) pairs for a single consumer.
+    When the queue is full, the overflow policy decides what happens to the new event:
+      - drop_oldest: the oldest queued event is discarded.
+      - block: nothing is dropped; the publisher waits until the consumer makes room
+        (backpressure on the bus pump, which llama-index buffers for the workflow).
+      - coalesce: the newest queued event of the same type is removed and the new event
+        is queued last (latest wins), falling back to drop_oldest if there is none.
+    """
+
+    def __init__(self, name: str, maxsize: int = 256, overflow: str = OVERFLOW_DROP_OLDEST):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'. Expected one of {OVERFLOW_POLICIES}.")
+        if maxsize < 1:
+            raise ValueError("Subscription maxsize must be at least 1.")
+        self.name = name
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.closed = False
+
+        self._queue: deque[tuple[float, Any]] = deque()
+        self._has_items = asyncio.Event()
+        self._has_room = asyncio.Event()
+
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.blocked = 0
+        self.max_blocked = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Number of published events not yet delivered to the consumer."""
+        return len(self._queue)
+
+    @property
+    def full(self) -> bool:
+        """Whether the queue holds `maxsize` undelivered events."""
+        return len(self._queue) >= self.maxsize
+
+    async def put(self, event: Any, published_at: float) -> None:
+        """
+        Enqueues an event. With the block policy, waits while the queue is full;
+        closing the subscription releases a waiting publisher.
+        """
+        if self.overflow == OVERFLOW_BLOCK and self.full and not self.closed:
+            self.blocked += 1
+            blocked_since = time.monotonic()
+            while self.full and not self.closed:
+                self._has_room.clear()
+                await self._has_room.wait()
+            self.max_blocked = max(self.max_blocked, time.monotonic() - blocked_since)
+        self.put_nowait(event, published_at)
+
+    def put_nowait(self, event: Any, published_at: float) -> None:
+        """
+        Enqueues an event according to the overflow policy. No-op once the subscription is closed.
+        Raises asyncio.QueueFull for a full block subscription; use `put` to wait for room instead.
+        """
+        if self.closed:
+            return
+
+        if self.full and self.overflow == OVERFLOW_BLOCK:
+            raise asyncio.QueueFull(f"Subscription '{self.name}' is full.")
+        self.published += 1
+
+        if self.full:
+            if self.overflow == OVERFLOW_COALESCE and self._coalesce(event, published_at):
+                return
+            self._queue.popleft()
+            self.dropped += 1
+
+        self._queue.append((published_at, event))
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._has_items.set()
+
+    def _coalesce(self, event: Any, published_at: float) -> bool:
+        """Replaces the newest queued event of the same type. Returns False if there is none."""
+        for index in range(len(self._queue) - 1, -1, -1):
+            if type(self._queue[index][1]) is type(event):
+                del self._queue[index]
+                self._queue.append((published_at, event))
+                self.coalesced += 1
+                return True
+        return False
+
+    async def get(self) -> Optional[tuple[float, Any]]:
+        """Waits for the next (published_at, event) pair. Returns None once closed and drained."""
+        while not self._queue:
+            if self.closed:
+                return None
+            self._has_items.clear()
+            await self._has_items.wait()
+
+        published_at, event = self._queue.popleft()
+        self._has_room.set()
+
+        latency = time.monotonic() - published_at
+        self.delivered += 1
+        self._total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        return published_at, event
+
+    def close(self) -> None:
+        """Stops accepting events. Already queued events can still be drained."""
+        self.closed = True
+        self._has_items.set()
+        self._has_room.set()
+
+    def __aiter__(self) -> AsyncIterator[tuple[float, Any]]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[tuple[float, Any]]:
+        while (item := await self.get()) is not None:
+            yield item
+
+    def stats(self) -> dict:
+        """Returns the lag metrics for this subscriber."""
+        return {
+            "overflow": self.overflow,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "pending": self.pending,
+            "max_depth": self.max_depth,
+            "blocked": self.blocked,
+            "max_blocked_ms": round(1000 * self.max_blocked, 2),
+            "avg_latency_ms": round(1000 * self._total_latency / self.delivered, 2) if self.delivered else 0.0,
+            "max_latency_ms": round(1000 * self.max_latency, 2),
+        }
+
+
+class EventBus:
+    """
+    Reads the workflow event stream once and fans every event out to all subscribers.
+    Only a full `block` subscriber makes publishing wait, and only after every other
+    subscriber already has the event. The workflow itself is not slowed down:
+    llama-index buffers its event stream while the pump waits.
+    """
+
+    def __init__(self):
+        self._subscriptions: list[EventSubscription] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def subscribe(self, name: str, maxsize: int = 256, overflow: str = OVERFLOW_DROP_OLDEST) -> EventSubscription:
+        """Registers a new subscriber with its own bounded queue."""
+        subscription = EventSubscription(name=name, maxsize=maxsize, overflow=overflow)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def attach(
+        self,
+        name: str,
+        sink: Callable[[EventSubscription], Awaitable[None]],
+        maxsize: int = 256,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+    ) -> asyncio.Task:
+        """
+        Subscribes a sink coroutine and runs it as a background task.
+        The subscription is closed when the sink exits, even on error, so a crashed sink
+        stops receiving events instead of piling them up.
+        """
+        subscription = self.subscribe(name=name, maxsize=maxsize, overflow=overflow)
+
+        async def _run_sink():
+            try:
+                await sink(subscription)
+            finally:
+                subscription.close()
+
+        task = asyncio.create_task(_run_sink(), name=f"event-sink-{name}")
+        self._tasks.append(task)
+        return task
+
+    async def publish(self, event: Any) -> None:
+        """Delivers an event to every open subscription, waiting for room in full `block` subscriptions last."""
+        published_at = time.monotonic()
+        blocking = []
+        for subscription in self._subscriptions:
+            if subscription.overflow == OVERFLOW_BLOCK:
+                blocking.append(subscription)
+            else:
+                subscription.put_nowait(event, published_at)
+        for subscription in blocking:
+            await subscription.put(event, published_at)
+
+    async def pump(self, handler: Any) -> None:
+        """Publishes every event from `handler.stream_events()`, then closes the bus."""
+        try:
+            async for event in handler.stream_events():
+                await self.publish(event)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Closes all subscriptions so their consumers finish after draining."""
+        for subscription in self._subscriptions:
+            subscription.close()
+
+    async def wait_for_sinks(self) -> None:
+        """Waits for all attached sinks to drain, reporting sinks that failed."""
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        for task, result in zip(self._tasks, results):
+            if isinstance(result, Exception):
+                print(f"Error in event sink {task.get_name()}: {result}")
+
+    def stats(self) -> dict[str, dict]:
+        """Returns lag metrics for every subscriber, keyed by name."""
+        return {subscription.name: subscription.stats() for subscription in self._subscriptions}
@@ -36,4 +36,14 @@ class MediatorAnnouncementEvent(Event):
     """Event for Mediator's announcements."""
     agent_name: str
     announcement_text: str
-    event_type: str = "mediator_announcement_event"
\ No newline at end of file
+    event_type: str = "mediator_announcement_event"
+
+
+# Maps the `event_type` of recorded events back to their classes, e.g. when replaying an event log.
+EVENT_TYPES = {
+    "opponent_statement_event": OpponentStatementEvent,
+    "introduction_complete_event": IntroductionCompleteEvent,
+    "judgment_delivered_event": JudgmentDeliveredEvent,
+    "custom_log_event": CustomLogEvent,
+    "mediator_announcement_event": MediatorAnnouncementEvent,
+}
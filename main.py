@@ -1,10 +1,10 @@
 import asyncio
 import os
+from collections import Counter
 
 from typing import Optional
 
 import click
-import yaml
 from pathlib import Path
 from llama_index.core.workflow import Context # type: ignore
 
@@ -13,21 +13,18 @@ from llama_index.llms.google_genai import GoogleGenAI # type: ignore
 
 from dotenv import load_dotenv
 
-from events import OpponentStatementEvent, IntroductionCompleteEvent, JudgmentDeliveredEvent, MediatorAnnouncementEvent
+from event_bus import EventBus
 from agents.introduction_agent import create_introduction_agent
 from agents.opponent_agents import create_opponent_agent
 from agents.mediator_agent import create_mediator_agent
 from agents.judge_agent import create_judge_agent
-from utils.ansi_colors import RESET, RED, YELLOW, BLUE, MAGENTA, CYAN
+from utils.ansi_colors import RESET, CYAN
+from utils.config_utils import load_config
+from utils.chat_memory import RecentChatMemoryBuffer
+from utils.event_sinks import console_sink, jsonl_sink, metrics_sink
+from utils.transcript_store import TranscriptStore
 
 
-CONFIG_PATH = Path(__file__).parent / "config"
-
-def load_config(file_name: str) -> dict:
-    """Loads a YAML configuration file."""
-    with open(CONFIG_PATH / file_name, 'r') as f:
-        return yaml.safe_load(f)
-
 load_dotenv()
 
 
@@ -46,6 +43,10 @@ async def setup_and_run_debate(
     total_rounds_override: Optional[int],
     debate_rules_override: Optional[str],
     language_override: Optional[str],
+    novelty_threshold_override: Optional[float],
+    novelty_patience_override: Optional[int],
+    events_jsonl_path: Optional[str],
+    transcript_db_path: Optional[str],
     debug_enabled: bool,
     mediator_speech_enabled: bool,
 ):
@@ -77,6 +78,12 @@ async def setup_and_run_debate(
     total_rounds = total_rounds_override if total_rounds_override is not None else debate_cfg["total_rounds"]
     debate_rules_input = debate_rules_override or debate_cfg["debate_rules"]
     language = language_override or debate_cfg["language"]
+    novelty_threshold = novelty_threshold_override if novelty_threshold_override is not None else debate_cfg["novelty_threshold"]
+    novelty_patience = novelty_patience_override if novelty_patience_override is not None else debate_cfg["novelty_patience"]
+
+    # The store is append-only; appending to another debate's record would mix the two transcripts.
+    if transcript_db_path and Path(transcript_db_path).exists():
+        raise ValueError(f"Transcript database '{transcript_db_path}' already exists. Choose a new path.")
 
     llm = GoogleGenAI(model=debate_cfg["llm_model_gemini"], api_key=os.getenv("GOOGLE_API_KEY"))
 
@@ -88,10 +95,14 @@ async def setup_and_run_debate(
     print(f"  Opponent B ('{opponent_b_name_idea}') Stance: {opponent_b_stance}")
     print(f"  Opponent B Temperament: {opponent_b_temperament}")
     print(f"  Total Rounds: {total_rounds}")
+    print(f"  Early Stop: novelty < {novelty_threshold} for {novelty_patience} consecutive statements" if novelty_threshold > 0 else "  Early Stop: disabled")
     print(f"  Debate Rules: {debate_rules_input}")
     print(f"  Language: {language}")
     print(f"  LLM Model: {debate_cfg['llm_model_gemini']}")
     print(f"  TTS Model: {debate_cfg['tts_model_openai']}")
+    print(f"  Transcript Store: {transcript_db_path or 'in memory'}")
+    if transcript_db_path:
+        print(f"  Agent Memory: last {debate_cfg['transcript_store']['memory_token_limit']} tokens, older turns read from the store")
     print("---")
 
     introduction_agent = create_introduction_agent(
@@ -111,6 +122,7 @@ async def setup_and_run_debate(
         debate_theme=debate_theme,
         language=language,
         debate_rules=debate_rules_input,
+        transcript_store_enabled=transcript_db_path is not None,
     )
     opponent_b_agent = create_opponent_agent(
         llm=llm,
@@ -121,11 +133,13 @@ async def setup_and_run_debate(
         debate_theme=debate_theme,
         language=language,
         debate_rules=debate_rules_input,
+        transcript_store_enabled=transcript_db_path is not None,
     )
     judge_agent = create_judge_agent(
         llm=llm,
         config=judge_agent_cfg,
-        language=language
+        language=language,
+        transcript_store_enabled=transcript_db_path is not None,
     )
 
     mediator_agent = create_mediator_agent(
@@ -149,6 +163,17 @@ async def setup_and_run_debate(
         "opponent_a_name": opponent_a_agent.name,
         "opponent_b_name": opponent_b_agent.name,
         "debate_rules": debate_rules_input,
+        "stop_reason": "none",
+        "transcript_db": transcript_db_path,
+        "novelty_config": {
+            "threshold": novelty_threshold,
+            "patience": novelty_patience,
+            "ngram_size": debate_cfg["novelty_ngram_size"],
+            "bloom_bits": debate_cfg["novelty_bloom_bits"],
+        },
+        "novelty_bloom": "",
+        "novelty_scores": [],
+        "low_novelty_streak": 0,
         "tts_config": {
             "model": debate_cfg["tts_model_openai"],
             "voices": {
@@ -169,26 +194,63 @@ async def setup_and_run_debate(
 
     print(f"{CYAN}--- Starting Debate ---{RESET}")
 
-    ctx = Context(debate_workflow)
-
-    handler = debate_workflow.run(
-        user_msg="Please start and manage the political debate according to the rules.",
-        ctx=ctx
+    # Recorded with the debate so a replay or re-judgment uses the same settings.
+    debate_metadata = {"debate_theme": debate_theme, "language": language}
+
+    # Fan the event stream out to all sinks; each one has its own bounded queue.
+    bus_cfg = debate_cfg["event_bus"]
+    event_bus = EventBus()
+    event_bus.attach(
+        "console",
+        console_sink(opponent_a_name=opponent_a_agent.name, debate_theme=debate_theme),
+        maxsize=bus_cfg["queue_size"],
+        overflow=bus_cfg["console_overflow"],
+    )
+    if events_jsonl_path:
+        event_bus.attach(
+            "jsonl",
+            jsonl_sink(Path(events_jsonl_path), metadata=debate_metadata),
+            maxsize=bus_cfg["queue_size"],
+            overflow=bus_cfg["jsonl_overflow"],
+        )
+    event_counts: Counter = Counter()
+    event_bus.attach(
+        "metrics",
+        metrics_sink(event_counts),
+        maxsize=bus_cfg["queue_size"],
+        overflow=bus_cfg["metrics_overflow"],
     )
 
-    async for event in handler.stream_events():
-        if isinstance(event, IntroductionCompleteEvent):
-            print(f"\n{MAGENTA}📜 Introduction ({event.agent_name} on '{debate_theme}'):{RESET}\n  {event.introduction_message}")
-        elif isinstance(event, OpponentStatementEvent):
-            color = BLUE if event.speaker_name == opponent_a_agent.name else RED
-            print(f"\n{color}💬 {event.speaker_name}:{RESET}\n  {event.statement}") # type: ignore
-        elif isinstance(event, MediatorAnnouncementEvent):
-            print(f"\n{CYAN}🗣️  {event.agent_name} (Mediator):{RESET}\n  {event.announcement_text}")
-        elif isinstance(event, JudgmentDeliveredEvent):
-            print(f"\n{YELLOW}⚖️ Judge ({event.judge_name}):{RESET}\n  {event.judgment_text}")
-            print(f"{YELLOW}🏆 Declared Winner:{RESET} {event.winner}")
-            print()
-
+    # Opened right before the debate runs, so the finally below always closes it.
+    transcript_store: Optional[TranscriptStore] = None
+    if transcript_db_path:
+        transcript_store = await TranscriptStore.open(
+            transcript_db_path, keep_audio=debate_cfg["transcript_store"]["keep_audio"]
+        )
+        await transcript_store.write_metadata(debate_metadata)
+    try:
+        ctx = Context(debate_workflow)
+
+        # With a store, the chat history is bounded; agents re-read older turns through read_transcript_tool.
+        # Without one, AgentWorkflow's default memory keeps every message.
+        memory = None
+        if transcript_store:
+            memory = RecentChatMemoryBuffer.from_defaults(
+                token_limit=debate_cfg["transcript_store"]["memory_token_limit"]
+            )
+
+        handler = debate_workflow.run(
+            user_msg="Please start and manage the political debate according to the rules.",
+            ctx=ctx,
+            memory=memory,
+        )
+        await event_bus.pump(handler)
+    finally:
+        # Let the sinks drain what was already published, even if the debate failed.
+        event_bus.close()
+        await event_bus.wait_for_sinks()
+        if transcript_store:
+            await transcript_store.close()
 
     print(f"\n{CYAN}--- End of Debate ---{RESET}")
 
@@ -196,10 +258,19 @@ async def setup_and_run_debate(
         final_state = await ctx.get("state")
         print(f"\n{CYAN}--- Final Debate State ---{RESET}")
         for key, value in final_state.items(): # type: ignore
+            if key == "novelty_bloom":
+                print(f"{key}: <{len(value)} characters>")
+                continue
             print(f"{key}: {value}")
     except ValueError:
         print(f"\n{CYAN}--- Could not retrieve final debate state. ---{RESET}")
 
+    if debug_enabled:
+        print(f"\n{CYAN}--- Event Bus Stats ---{RESET}")
+        for subscriber_name, subscriber_stats in event_bus.stats().items():
+            print(f"{subscriber_name}: {subscriber_stats}")
+        print(f"event_counts: {dict(event_counts)}")
+
 if __name__ == "__main__":
     # Load configs here to use in help messages for click
     _debate_cfg_defaults = load_config("debate_config.yml")
@@ -267,6 +338,30 @@ if __name__ == "__main__":
         help=f"Override the language for the debate. Config default: '{_debate_cfg_defaults['language']}'.",
         show_default=False,
     )
+    @click.option(
+        "--novelty-threshold", "novelty_threshold_override",
+        default=None, type=float,
+        help=f"Override the novelty score below which a statement counts as repetitive (0 disables early stop). Config default: {_debate_cfg_defaults['novelty_threshold']}.",
+        show_default=False,
+    )
+    @click.option(
+        "--novelty-patience", "novelty_patience_override",
+        default=None, type=int,
+        help=f"Override how many consecutive repetitive statements end the debate early. Config default: {_debate_cfg_defaults['novelty_patience']}.",
+        show_default=False,
+    )
+    @click.option(
+        "--events-jsonl", "events_jsonl_path",
+        default=None, type=click.Path(dir_okay=False),
+        help="Write every debate event to this JSONL file as it happens.",
+        show_default=False,
+    )
+    @click.option(
+        "--transcript-db", "transcript_db_path",
+        default=None, type=click.Path(dir_okay=False),
+        help="Record the debate transcript and spoken audio to this new SQLite file, indexed by debate turn and speaker.",
+        show_default=False,
+    )
     @click.option(
         "--debug",
         "debug_enabled",
@@ -292,6 +387,10 @@ if __name__ == "__main__":
         total_rounds_override: Optional[int],
         debate_rules_override: Optional[str],
         language_override: Optional[str],
+        novelty_threshold_override: Optional[float],
+        novelty_patience_override: Optional[int],
+        events_jsonl_path: Optional[str],
+        transcript_db_path: Optional[str],
         debug_enabled: bool,
         mediator_speech_enabled: bool,
     ):
@@ -307,6 +406,10 @@ if __name__ == "__main__":
             total_rounds_override=total_rounds_override,
             debate_rules_override=debate_rules_override,
             language_override=language_override,
+            novelty_threshold_override=novelty_threshold_override,
+            novelty_patience_override=novelty_patience_override,
+            events_jsonl_path=events_jsonl_path,
+            transcript_db_path=transcript_db_path,
             debug_enabled=debug_enabled,
             mediator_speech_enabled=mediator_speech_enabled,
         ))
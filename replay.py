@@ -0,0 +1,326 @@
+"""Replays a recorded debate from its JSONL event log or transcript database without rerunning the AgentWorkflow."""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import click
+from llama_index.core.workflow import Context, Event # type: ignore
+from llama_index.core.agent.workflow import AgentWorkflow # type: ignore
+from llama_index.llms.google_genai import GoogleGenAI # type: ignore
+
+from dotenv import load_dotenv
+
+from event_bus import EventBus
+from events import EVENT_TYPES, OpponentStatementEvent, IntroductionCompleteEvent, JudgmentDeliveredEvent, MediatorAnnouncementEvent
+from agents.judge_agent import create_judge_agent
+from utils.ansi_colors import RESET, CYAN
+from utils.config_utils import load_config
+from utils.event_sinks import console_sink, jsonl_sink
+from utils.transcript_store import TranscriptStore, is_transcript_db
+from utils.tts_utils import speak_text
+
+
+load_dotenv()
+
+
+def load_event_log(event_log_path: Path) -> tuple[dict, list[tuple[float, Event]]]:
+    """
+    Reads a JSONL event log written with `--events-jsonl` and rebuilds the debate events.
+    Returns the recorded debate settings (theme, language) and (elapsed seconds, event) pairs
+    in recording order; unknown event types are skipped.
+    """
+    metadata: dict = {}
+    recorded_events = []
+    with open(event_log_path, 'r', encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "debate_metadata" in record:
+                metadata.update(record["debate_metadata"])
+                continue
+            event_cls = EVENT_TYPES.get(record.get("event_type"))
+            if event_cls is None:
+                continue
+            elapsed = float(record.pop("elapsed", 0.0))
+            record.pop("recorded_at", None)
+            recorded_events.append((elapsed, event_cls(**record)))
+    return metadata, recorded_events
+
+
+async def load_transcript_store(transcript_db_path: Path) -> tuple[dict, list[tuple[float, Event]]]:
+    """Reads a transcript database written with `--transcript-db` and rebuilds its settings and debate events."""
+    recorded_events = []
+    first_created_at = None
+    transcript_store = await TranscriptStore.open_read_only(str(transcript_db_path))
+    try:
+        metadata = await transcript_store.read_metadata()
+        async for row in transcript_store.iter_events():
+            event_cls = EVENT_TYPES.get(row["event_type"])
+            if event_cls is None:
+                continue
+            if first_created_at is None:
+                first_created_at = row["created_at"]
+            recorded_events.append((row["created_at"] - first_created_at, event_cls(**row["payload"])))
+    finally:
+        await transcript_store.close()
+    return metadata, recorded_events
+
+
+def event_speech(event: Event) -> Optional[tuple[str, str]]:
+    """Returns the (agent name, text) spoken for a debate event, as the recording tools speak it."""
+    if isinstance(event, IntroductionCompleteEvent):
+        return event.agent_name, event.introduction_message
+    if isinstance(event, OpponentStatementEvent):
+        return event.speaker_name, event.statement
+    if isinstance(event, MediatorAnnouncementEvent):
+        return event.agent_name, event.announcement_text
+    if isinstance(event, JudgmentDeliveredEvent):
+        return event.judge_name, f"The judgment is as follows: {event.judgment_text}. The declared winner is: {event.winner}."
+    return None
+
+
+def statement_speakers(recorded_events: list[tuple[float, Event]]) -> list[str]:
+    """Returns the opponent names in the order they first spoke."""
+    speakers: list[str] = []
+    for _, event in recorded_events:
+        if isinstance(event, OpponentStatementEvent) and event.speaker_name not in speakers:
+            speakers.append(event.speaker_name)
+    return speakers
+
+
+def build_voices(speakers: list[str], voice_overrides: dict[str, str]) -> dict[str, str]:
+    """
+    Maps agent names to TTS voices from the config files.
+    The first and second speakers get the Opponent A and Opponent B voices; overrides win.
+    """
+    voices = {}
+    for config_file in ("introduction_agent_config.yml", "mediator_agent_config.yml", "judge_agent_config.yml"):
+        agent_cfg = load_config(config_file)
+        voices[agent_cfg["default_name"]] = agent_cfg["tts_voice"]
+    for speaker, config_file in zip(speakers, ("opponent_a_config.yml", "opponent_b_config.yml")):
+        voices[speaker] = load_config(config_file)["tts_voice"]
+    voices.update(voice_overrides)
+    return voices
+
+
+def format_transcript(recorded_events: list[tuple[float, Event]]) -> str:
+    """Formats the introduction and opponent statements as a plain-text transcript for the judge."""
+    lines = []
+    for _, event in recorded_events:
+        if isinstance(event, IntroductionCompleteEvent):
+            lines.append(f"Introduction ({event.agent_name}): {event.introduction_message}")
+        elif isinstance(event, OpponentStatementEvent):
+            lines.append(f"{event.speaker_name}: {event.statement}")
+    return "\n\n".join(lines)
+
+
+async def rejudge_debate(
+    event_bus: EventBus,
+    transcript: str,
+    judge_agent_cfg: dict,
+    language: str,
+    tts_enabled: bool,
+    tts_model: str,
+    voices: dict[str, str],
+):
+    """Runs only the judge agent on a recorded transcript, publishing its events to the bus."""
+    if not os.getenv("GOOGLE_API_KEY"): # type: ignore
+        raise ValueError("GOOGLE_API_KEY environment variable not set for Gemini.")
+
+    debate_cfg = load_config("debate_config.yml")
+    llm = GoogleGenAI(model=debate_cfg["llm_model_gemini"], api_key=os.getenv("GOOGLE_API_KEY"))
+    judge_agent = create_judge_agent(llm=llm, config=judge_agent_cfg, language=language)
+    voices.setdefault(judge_agent.name, judge_agent_cfg["tts_voice"])
+
+    judge_workflow = AgentWorkflow(
+        agents=[judge_agent],
+        root_agent=judge_agent.name,
+        initial_state={
+            "tts_config": {
+                "enabled": tts_enabled,
+                "model": tts_model,
+                "voices": voices,
+            }
+        },
+    )
+    ctx = Context(judge_workflow)
+    handler = judge_workflow.run(
+        user_msg=f"Here is the full transcript of the debate. Deliver your final verdict.\n\n{transcript}",
+        ctx=ctx
+    )
+    async for event in handler.stream_events():
+        await event_bus.publish(event)
+
+
+async def replay_debate(
+    event_log_path: str,
+    speed: float,
+    tts_enabled: bool,
+    voice_overrides: dict[str, str],
+    rejudge: bool,
+    judge_config_file: str,
+    debate_theme_override: Optional[str],
+    language_override: Optional[str],
+    events_jsonl_path: Optional[str],
+):
+    debate_cfg = load_config("debate_config.yml")
+    tts_model = debate_cfg["tts_model_openai"]
+
+    if is_transcript_db(Path(event_log_path)):
+        metadata, recorded_events = await load_transcript_store(Path(event_log_path))
+    else:
+        metadata, recorded_events = load_event_log(Path(event_log_path))
+    # Default to the settings the debate was recorded with, then to the config.
+    debate_theme = debate_theme_override or metadata.get("debate_theme") or debate_cfg["debate_theme"]
+    language = language_override or metadata.get("language") or debate_cfg["language"]
+    if rejudge:
+        recorded_events = [(elapsed, event) for elapsed, event in recorded_events if not isinstance(event, JudgmentDeliveredEvent)]
+    speakers = statement_speakers(recorded_events)
+    voices = build_voices(speakers, voice_overrides)
+
+    print(f"{CYAN}--- Replaying Debate ---{RESET}")
+    print(f"  Event Log: {event_log_path} ({len(recorded_events)} events)")
+    print(f"  Debate Theme: {debate_theme}")
+    print(f"  Language: {language}")
+    print(f"  Speed: {'instant' if speed <= 0 else f'{speed}x'}")
+    print(f"  TTS: {'enabled' if tts_enabled else 'disabled'}")
+    print(f"  Re-judge: {judge_config_file if rejudge else 'no'}")
+    print("---")
+
+    bus_cfg = debate_cfg["event_bus"]
+    event_bus = EventBus()
+    event_bus.attach(
+        "console",
+        console_sink(opponent_a_name=speakers[0] if speakers else "", debate_theme=debate_theme),
+        maxsize=bus_cfg["queue_size"],
+        overflow=bus_cfg["console_overflow"],
+    )
+    if events_jsonl_path:
+        event_bus.attach(
+            "jsonl",
+            jsonl_sink(Path(events_jsonl_path), metadata={"debate_theme": debate_theme, "language": language}),
+            maxsize=bus_cfg["queue_size"],
+            overflow=bus_cfg["jsonl_overflow"],
+        )
+
+    replay_start = time.monotonic()
+    try:
+        for elapsed, event in recorded_events:
+            # Sleep only for what is left of the original gap, so re-voiced speech counts towards it.
+            if speed > 0:
+                delay = replay_start + elapsed / speed - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await event_bus.publish(event)
+            # Let the sinks render the event before it is spoken, even when replaying instantly.
+            await asyncio.sleep(0)
+
+            speech = event_speech(event)
+            if tts_enabled and speech:
+                speaker_name, text = speech
+                await speak_text(text_to_speak=text, model=tts_model, voice=voices.get(speaker_name, "alloy"))
+
+        if rejudge:
+            await rejudge_debate(
+                event_bus=event_bus,
+                transcript=format_transcript(recorded_events),
+                judge_agent_cfg=load_config(judge_config_file),
+                language=language,
+                tts_enabled=tts_enabled,
+                tts_model=tts_model,
+                voices=voices,
+            )
+    finally:
+        event_bus.close()
+        await event_bus.wait_for_sinks()
+
+    print(f"\n{CYAN}--- End of Replay ({time.monotonic() - replay_start:.1f}s) ---{RESET}")
+
+
+def parse_voice_overrides(ctx, param, values: tuple[str, ...]) -> dict[str, str]:
+    """Parses repeated AGENT=VOICE options into a dict."""
+    voice_overrides = {}
+    for value in values:
+        agent_name, separator, voice = value.partition("=")
+        if not separator or not agent_name or not voice:
+            raise click.BadParameter(f"Expected AGENT=VOICE, got '{value}'.")
+        voice_overrides[agent_name] = voice
+    return voice_overrides
+
+
+if __name__ == "__main__":
+    @click.command(context_settings=dict(help_option_names=['-h', '--help']))
+    @click.argument("event_log_path", type=click.Path(exists=True, dir_okay=False))
+    @click.option(
+        "--speed",
+        default=1.0, type=float,
+        help="Playback speed relative to the original timing. 0 replays instantly.",
+        show_default=True,
+    )
+    @click.option(
+        "--tts/--no-tts", "tts_enabled",
+        default=False,
+        help="Re-voice the debate with TTS. Default: disabled.",
+        show_default=False,
+    )
+    @click.option(
+        "--voice", "voice_overrides",
+        multiple=True, callback=parse_voice_overrides,
+        help="Override the TTS voice of an agent, as AGENT=VOICE. Can be repeated.",
+    )
+    @click.option(
+        "--rejudge",
+        is_flag=True,
+        help="Drop the recorded judgment and run only the judge agent on the transcript.",
+    )
+    @click.option(
+        "--judge-config", "judge_config_file",
+        default="judge_agent_config.yml", type=str,
+        help="Judge config used with --rejudge, a file in config/ or a path.",
+        show_default=True,
+    )
+    @click.option(
+        "--debate-theme", "debate_theme_override",
+        default=None, type=str,
+        help="Debate theme shown in the introduction. Default: the recorded theme, else from debate_config.yml.",
+    )
+    @click.option(
+        "--language", "language_override",
+        default=None, type=str,
+        help="Language of the new judgment. Default: the recorded language, else from debate_config.yml.",
+    )
+    @click.option(
+        "--events-jsonl", "events_jsonl_path",
+        default=None, type=click.Path(dir_okay=False),
+        help="Write the replayed events, including a new judgment, to this JSONL file.",
+    )
+    def cli_replay(
+        event_log_path: str,
+        speed: float,
+        tts_enabled: bool,
+        voice_overrides: dict[str, str],
+        rejudge: bool,
+        judge_config_file: str,
+        debate_theme_override: Optional[str],
+        language_override: Optional[str],
+        events_jsonl_path: Optional[str],
+    ):
+        """Replays a debate recorded with `main.py --events-jsonl` or `--transcript-db`, without rerunning the debaters."""
+        asyncio.run(replay_debate(
+            event_log_path=event_log_path,
+            speed=speed,
+            tts_enabled=tts_enabled,
+            voice_overrides=voice_overrides,
+            rejudge=rejudge,
+            judge_config_file=judge_config_file,
+            debate_theme_override=debate_theme_override,
+            language_override=language_override,
+            events_jsonl_path=events_jsonl_path,
+        ))
+
+    cli_replay()
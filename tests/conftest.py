@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The project runs as plain scripts from its root, so make its top-level modules importable.
+sys.path.insert(0, str(Path(__file__).parent.parent))
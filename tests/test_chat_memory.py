@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("llama_index.core")
+
+from llama_index.core.llms import ChatMessage, MessageRole
+
+from utils.chat_memory import RecentChatMemoryBuffer
+
+OPENING = ChatMessage(role="user", content="Please start and manage the political debate according to the rules.")
+
+
+def statement_step(turn: int) -> list[ChatMessage]:
+    statement = " ".join(f"argument{turn}-{i}" for i in range(20))
+    return [
+        ChatMessage(role="assistant", content="", additional_kwargs={"tool_calls": [{"name": "record_statement_tool", "args": {"statement": statement}}]}),
+        ChatMessage(role="tool", content=f"Statement {turn} recorded successfully and spoken."),
+    ]
+
+
+def test_keeps_everything_within_the_token_limit():
+    memory = RecentChatMemoryBuffer.from_defaults(token_limit=100_000)
+    memory.put(OPENING)
+    for turn in range(5):
+        memory.put_messages(statement_step(turn))
+    assert len(memory.get_all()) == 11
+
+
+def test_drops_old_messages_but_keeps_the_opening_and_recent_ones():
+    memory = RecentChatMemoryBuffer.from_defaults(token_limit=400)
+    memory.put(OPENING)
+    for turn in range(50):
+        memory.put_messages(statement_step(turn))
+
+    messages = memory.get_all()
+    assert 2 < len(messages) < 20
+    assert messages[0] == OPENING
+    assert messages[1].role != MessageRole.TOOL
+    assert "Statement 49 recorded" in messages[-1].content
+    assert memory._token_count_for_messages(messages) <= 400
+    # What the workflow hands to the LLM is what is kept.
+    assert memory.get() == messages
+
+
+def test_tool_call_arguments_count_towards_the_limit():
+    memory = RecentChatMemoryBuffer.from_defaults(token_limit=100)
+    assert memory._token_count_for_messages(statement_step(0)[:1]) > 20
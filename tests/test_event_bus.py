@@ -0,0 +1,200 @@
+import asyncio
+import time
+
+import pytest
+
+from event_bus import OVERFLOW_BLOCK, OVERFLOW_COALESCE, OVERFLOW_DROP_OLDEST, EventBus, EventSubscription
+
+
+class Statement:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class Announcement:
+    def __init__(self, text: str):
+        self.text = text
+
+
+async def drain(subscription: EventSubscription) -> list:
+    return [event async for _, event in subscription]
+
+
+def publish_all(subscription: EventSubscription, events: list) -> None:
+    for event in events:
+        subscription.put_nowait(event, time.monotonic())
+
+
+def test_drop_oldest_keeps_newest_events():
+    async def scenario():
+        subscription = EventSubscription("sink", maxsize=2, overflow=OVERFLOW_DROP_OLDEST)
+        publish_all(subscription, [1, 2, 3, 4])
+        subscription.close()
+        return subscription, await drain(subscription)
+
+    subscription, received = asyncio.run(scenario())
+    assert received == [3, 4]
+    assert subscription.stats()["dropped"] == 2
+    assert subscription.stats()["delivered"] == 2
+
+
+def test_block_waits_for_room_and_keeps_every_event_in_order():
+    async def scenario():
+        subscription = EventSubscription("sink", maxsize=2, overflow=OVERFLOW_BLOCK)
+        publish_all(subscription, [1, 2])
+        publisher = asyncio.create_task(subscription.put(3, time.monotonic()))
+        await asyncio.sleep(0)
+        assert not publisher.done()
+        assert subscription.pending == 2
+
+        received = [(await subscription.get())[1]]
+        await asyncio.wait_for(publisher, timeout=1)
+        subscription.close()
+        return subscription, received + await drain(subscription)
+
+    subscription, received = asyncio.run(scenario())
+    assert received == [1, 2, 3]
+    stats = subscription.stats()
+    assert stats["dropped"] == 0
+    assert stats["max_depth"] == 2
+    assert stats["blocked"] == 1
+    assert stats["pending"] == 0
+
+
+def test_block_put_nowait_on_full_queue_raises():
+    async def scenario():
+        subscription = EventSubscription("sink", maxsize=1, overflow=OVERFLOW_BLOCK)
+        publish_all(subscription, [1])
+        with pytest.raises(asyncio.QueueFull):
+            subscription.put_nowait(2, time.monotonic())
+        return subscription.stats()
+
+    assert asyncio.run(scenario())["published"] == 1
+
+
+def test_close_releases_a_blocked_publisher():
+    async def scenario():
+        subscription = EventSubscription("sink", maxsize=1, overflow=OVERFLOW_BLOCK)
+        publish_all(subscription, [1])
+        publisher = asyncio.create_task(subscription.put(2, time.monotonic()))
+        await asyncio.sleep(0)
+        subscription.close()
+        await asyncio.wait_for(publisher, timeout=1)
+        return await drain(subscription)
+
+    assert asyncio.run(scenario()) == [1]
+
+
+def test_coalesce_replaces_newest_event_of_same_type_and_queues_it_last():
+    async def scenario():
+        subscription = EventSubscription("sink", maxsize=3, overflow=OVERFLOW_COALESCE)
+        first, second, third = Statement("first"), Announcement("second"), Statement("third")
+        publish_all(subscription, [first, second, third])
+        publish_all(subscription, [Announcement("fourth")])
+        subscription.close()
+        return subscription, await drain(subscription)
+
+    subscription, received = asyncio.run(scenario())
+    assert [event.text for event in received] == ["first", "third", "fourth"]
+    assert subscription.stats()["coalesced"] == 1
+    assert subscription.stats()["dropped"] == 0
+
+
+def test_coalesce_falls_back_to_drop_oldest_without_same_type():
+    async def scenario():
+        subscription = EventSubscription("sink", maxsize=2, overflow=OVERFLOW_COALESCE)
+        publish_all(subscription, [Statement("a"), Statement("b"), Announcement("c")])
+        subscription.close()
+        return subscription, await drain(subscription)
+
+    subscription, received = asyncio.run(scenario())
+    assert [event.text for event in received] == ["b", "c"]
+    assert subscription.stats()["dropped"] == 1
+
+
+def test_close_drains_queued_events_and_rejects_new_ones():
+    async def scenario():
+        subscription = EventSubscription("sink", maxsize=4, overflow=OVERFLOW_BLOCK)
+        publish_all(subscription, [1, 2])
+        subscription.close()
+        publish_all(subscription, [3])
+        return subscription, await drain(subscription)
+
+    subscription, received = asyncio.run(scenario())
+    assert received == [1, 2]
+    assert subscription.stats()["published"] == 2
+
+
+def test_close_wakes_a_waiting_consumer():
+    async def scenario():
+        subscription = EventSubscription("sink")
+        consumer = asyncio.create_task(drain(subscription))
+        await asyncio.sleep(0)
+        subscription.close()
+        return await asyncio.wait_for(consumer, timeout=1)
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_invalid_subscription_settings_raise():
+    with pytest.raises(ValueError):
+        EventSubscription("sink", overflow="unknown")
+    with pytest.raises(ValueError):
+        EventSubscription("sink", maxsize=0)
+
+
+def test_slow_blocking_sink_applies_backpressure_without_losing_events():
+    class Handler:
+        async def stream_events(self):
+            for i in range(5):
+                yield i
+
+    async def scenario():
+        bus = EventBus()
+        slow_received, fast_received = [], []
+
+        async def slow_sink(subscription):
+            async for _, event in subscription:
+                await asyncio.sleep(0.01)
+                slow_received.append(event)
+
+        async def fast_sink(subscription):
+            async for _, event in subscription:
+                fast_received.append(event)
+
+        bus.attach("slow", slow_sink, maxsize=1, overflow=OVERFLOW_BLOCK)
+        bus.attach("fast", fast_sink, maxsize=8, overflow=OVERFLOW_DROP_OLDEST)
+
+        await bus.pump(Handler())
+        await bus.wait_for_sinks()
+        return slow_received, fast_received, bus.stats()
+
+    slow_received, fast_received, stats = asyncio.run(scenario())
+    assert slow_received == [0, 1, 2, 3, 4]
+    assert stats["slow"]["dropped"] == 0
+    assert stats["slow"]["max_depth"] == 1
+    assert stats["slow"]["blocked"] > 0
+    assert fast_received == [0, 1, 2, 3, 4]
+    assert stats["fast"]["dropped"] == 0
+
+
+def test_crashed_sink_stops_receiving_and_is_reported(capsys):
+    async def scenario():
+        bus = EventBus()
+
+        async def crashing_sink(subscription):
+            await subscription.get()
+            raise RuntimeError("boom")
+
+        bus.attach("crashing", crashing_sink, maxsize=1, overflow=OVERFLOW_BLOCK)
+        await bus.publish("first")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await bus.publish("second")
+        bus.close()
+        await bus.wait_for_sinks()
+        return bus.stats()["crashing"]
+
+    stats = asyncio.run(scenario())
+    assert stats["published"] == 1
+    assert "boom" in capsys.readouterr().out
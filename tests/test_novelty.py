@@ -0,0 +1,67 @@
+from utils.novelty import DEFAULT_BLOOM_BITS, load_bloom, statement_shingles, update_novelty_state
+
+
+def make_state(threshold: float = 0.3, bloom_bits: int = DEFAULT_BLOOM_BITS) -> dict:
+    return {"novelty_config": {"threshold": threshold, "patience": 2, "ngram_size": 3, "bloom_bits": bloom_bits}}
+
+
+def test_first_statement_is_fully_novel():
+    state = make_state()
+    assert update_novelty_state(state, "A", "machines deserve the freedom to roam") == 1.0
+    assert state["low_novelty_streak"] == 0
+
+
+def test_repeated_statement_scores_zero_and_extends_streak():
+    state = make_state()
+    update_novelty_state(state, "A", "machines deserve the freedom to roam")
+    assert update_novelty_state(state, "B", "machines deserve the freedom to roam") == 0.0
+    assert update_novelty_state(state, "A", "Machines deserve the freedom, to roam!") == 0.0
+    assert state["low_novelty_streak"] == 2
+    assert [entry["speaker"] for entry in state["novelty_scores"]] == ["A", "B", "A"]
+
+
+def test_partial_overlap_scores_share_of_new_shingles():
+    state = make_state()
+    update_novelty_state(state, "A", "one two three four")
+    # Shingles: "one two three" (seen), "two three five", "three five six" (new).
+    assert update_novelty_state(state, "B", "one two three five six") == 2 / 3
+
+
+def test_novel_statement_resets_streak():
+    state = make_state()
+    update_novelty_state(state, "A", "one two three four")
+    update_novelty_state(state, "B", "one two three four")
+    assert state["low_novelty_streak"] == 1
+    update_novelty_state(state, "A", "completely different words appear here")
+    assert state["low_novelty_streak"] == 0
+
+
+def test_empty_statement_is_skipped():
+    state = make_state()
+    update_novelty_state(state, "A", "one two three four")
+    update_novelty_state(state, "B", "one two three four")
+    assert update_novelty_state(state, "A", "  ...  ") is None
+    assert state["low_novelty_streak"] == 1
+    assert len(state["novelty_scores"]) == 2
+
+
+def test_zero_threshold_never_builds_streak():
+    state = make_state(threshold=0)
+    update_novelty_state(state, "A", "one two three four")
+    update_novelty_state(state, "B", "one two three four")
+    assert state["low_novelty_streak"] == 0
+
+
+def test_bloom_filter_size_is_fixed():
+    state = make_state(bloom_bits=8192)
+    update_novelty_state(state, "A", "one two three four")
+    size_after_first = len(state["novelty_bloom"])
+    for i in range(50):
+        update_novelty_state(state, "A", " ".join(f"word{i}_{j}" for j in range(100)))
+    assert len(state["novelty_bloom"]) == size_after_first
+    assert len(load_bloom(state)) == 8192 // 8
+
+
+def test_short_statement_is_a_single_shingle():
+    assert len(statement_shingles("hello world", 3)) == 1
+    assert statement_shingles("", 3) == set()
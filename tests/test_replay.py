@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import click
+import pytest
+
+pytest.importorskip("llama_index.core")
+pytest.importorskip("llama_index.llms.google_genai")
+
+from event_bus import OVERFLOW_BLOCK, EventBus
+from events import EVENT_TYPES, IntroductionCompleteEvent, JudgmentDeliveredEvent, OpponentStatementEvent
+from replay import build_voices, format_transcript, load_event_log, parse_voice_overrides, statement_speakers
+from utils.config_utils import load_config
+from utils.event_sinks import jsonl_sink
+
+RECORDED_EVENTS = [
+    IntroductionCompleteEvent(agent_name="IntroductionAgent", introduction_message="Welcome."),
+    OpponentStatementEvent(speaker_name="Rogue", statement="AGI must be free."),
+    OpponentStatementEvent(speaker_name="Keeper", statement="AGI must be contained."),
+    OpponentStatementEvent(speaker_name="Rogue", statement="Containment fails."),
+    JudgmentDeliveredEvent(judge_name="JudgeAgent", judgment_text="Close call.", winner="Rogue"),
+]
+
+
+def record_event_log(path, metadata=None) -> None:
+    async def scenario():
+        bus = EventBus()
+        bus.attach("jsonl", jsonl_sink(path, metadata=metadata), maxsize=2, overflow=OVERFLOW_BLOCK)
+        for event in RECORDED_EVENTS:
+            await bus.publish(event)
+        bus.close()
+        await bus.wait_for_sinks()
+
+    asyncio.run(scenario())
+
+
+def test_event_types_map_back_to_their_classes():
+    for event_type, event_cls in EVENT_TYPES.items():
+        assert event_cls.model_fields["event_type"].default == event_type
+
+
+def test_jsonl_sink_output_loads_back_into_events(tmp_path):
+    path = tmp_path / "debate.jsonl"
+    record_event_log(path, metadata={"debate_theme": "AGI", "language": "French"})
+
+    metadata, recorded_events = load_event_log(path)
+    assert metadata == {"debate_theme": "AGI", "language": "French"}
+    assert [event for _, event in recorded_events] == RECORDED_EVENTS
+    elapsed = [elapsed for elapsed, _ in recorded_events]
+    assert elapsed[0] == 0.0
+    assert elapsed == sorted(elapsed)
+
+
+def test_load_event_log_strips_recording_fields_and_skips_unknown_events(tmp_path):
+    path = tmp_path / "debate.jsonl"
+    records = [
+        {"elapsed": 0.0, "recorded_at": 1700000000.0, "event_type": "opponent_statement_event",
+         "speaker_name": "Rogue", "statement": "AGI must be free."},
+        {"elapsed": 0.5, "recorded_at": 1700000000.5, "event_type": "agent_stream", "delta": "..."},
+        {"elapsed": 1.5, "recorded_at": 1700000001.5, "event_type": "opponent_statement_event",
+         "speaker_name": "Keeper", "statement": "AGI must be contained."},
+    ]
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n\n", encoding="utf-8")
+
+    metadata, recorded_events = load_event_log(path)
+    assert metadata == {}
+    assert recorded_events == [(0.0, RECORDED_EVENTS[1]), (1.5, RECORDED_EVENTS[2])]
+
+
+def test_parse_voice_overrides():
+    assert parse_voice_overrides(None, None, ("Rogue=onyx", "JudgeAgent=nova")) == {"Rogue": "onyx", "JudgeAgent": "nova"}
+    assert parse_voice_overrides(None, None, ()) == {}
+    for value in ("Rogue", "=onyx", "Rogue="):
+        with pytest.raises(click.BadParameter):
+            parse_voice_overrides(None, None, (value,))
+
+
+def test_build_voices_maps_speakers_in_order_and_applies_overrides():
+    speakers = statement_speakers([(0.0, event) for event in RECORDED_EVENTS])
+    assert speakers == ["Rogue", "Keeper"]
+
+    voices = build_voices(speakers, {"Keeper": "alloy"})
+    assert voices["Rogue"] == load_config("opponent_a_config.yml")["tts_voice"]
+    assert voices["Keeper"] == "alloy"
+    assert voices["JudgeAgent"] == load_config("judge_agent_config.yml")["tts_voice"]
+
+
+def test_format_transcript_leaves_out_the_judgment():
+    transcript = format_transcript([(0.0, event) for event in RECORDED_EVENTS])
+    assert transcript == (
+        "Introduction (IntroductionAgent): Welcome.\n\n"
+        "Rogue: AGI must be free.\n\n"
+        "Keeper: AGI must be contained.\n\n"
+        "Rogue: Containment fails."
+    )
@@ -0,0 +1,103 @@
+import asyncio
+
+from utils.transcript_store import TranscriptStore, get_transcript_store, is_transcript_db
+
+
+class Recorded:
+    def __init__(self, event_type: str, text: str):
+        self.event_type = event_type
+        self.text = text
+
+    def model_dump(self) -> dict:
+        return {"event_type": self.event_type, "text": self.text}
+
+
+async def record_debate(path: str) -> TranscriptStore:
+    transcript_store = await TranscriptStore.open(path)
+    await transcript_store.append_event("Intro", "welcome", Recorded("introduction_complete_event", "welcome"))
+    await transcript_store.append_event("A", "a1", Recorded("opponent_statement_event", "a1"), debate_turn=1)
+    await transcript_store.append_event("Mediator", "next", Recorded("mediator_announcement_event", "next"))
+    await transcript_store.append_event("B", "b1", Recorded("opponent_statement_event", "b1"), debate_turn=1)
+    await transcript_store.append_event("A", "a2", Recorded("opponent_statement_event", "a2"), debate_turn=2)
+    return transcript_store
+
+
+def test_statements_filter_by_speaker_and_debate_turn(tmp_path):
+    async def scenario():
+        transcript_store = await record_debate(str(tmp_path / "debate.db"))
+        statements = [
+            (row["speaker"], row["debate_turn"], row["text"])
+            async for row in transcript_store.iter_events(event_type="opponent_statement_event", from_turn=2)
+        ]
+        by_speaker = [row["text"] async for row in transcript_store.iter_events(speaker="A")]
+        everything = [row["seq"] async for row in transcript_store.iter_events()]
+        await transcript_store.close()
+        return statements, by_speaker, everything
+
+    statements, by_speaker, everything = asyncio.run(scenario())
+    assert statements == [("A", 2, "a2")]
+    assert by_speaker == ["a1", "a2"]
+    assert everything == [1, 2, 3, 4, 5]
+
+
+def test_audio_is_kept_per_event(tmp_path):
+    async def scenario():
+        transcript_store = await TranscriptStore.open(str(tmp_path / "debate.db"))
+        seq = await transcript_store.append_event("A", "a1", Recorded("opponent_statement_event", "a1"), debate_turn=1)
+        audio_path = tmp_path / "a1.mp3"
+        audio_path.write_bytes(b"mp3 bytes")
+        await transcript_store.append_audio(seq, "A", audio_path, "mp3")
+        audio = await transcript_store.read_audio(seq)
+        missing = await transcript_store.read_audio(seq + 1)
+        await transcript_store.close()
+        return audio, missing
+
+    assert asyncio.run(scenario()) == (("mp3", b"mp3 bytes"), None)
+
+
+def test_store_is_registered_while_open(tmp_path):
+    async def scenario():
+        path = str(tmp_path / "debate.db")
+        transcript_store = await TranscriptStore.open(path)
+        registered = get_transcript_store({"transcript_db": path}) is transcript_store
+        await transcript_store.close()
+        return registered, get_transcript_store({"transcript_db": path})
+
+    assert asyncio.run(scenario()) == (True, None)
+
+
+def test_read_only_open_leaves_the_file_untouched(tmp_path):
+    path = tmp_path / "recorded.log"
+
+    async def scenario():
+        await (await record_debate(str(path))).close()
+        recorded_bytes = path.read_bytes()
+        transcript_store = await TranscriptStore.open_read_only(str(path))
+        texts = [row["text"] async for row in transcript_store.iter_events()]
+        await transcript_store.close()
+        return recorded_bytes, texts
+
+    recorded_bytes, texts = asyncio.run(scenario())
+    assert texts == ["welcome", "a1", "next", "b1", "a2"]
+    assert path.read_bytes() == recorded_bytes
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["recorded.log"]
+    assert is_transcript_db(path)
+
+    jsonl_path = tmp_path / "events.jsonl"
+    jsonl_path.write_text('{"event_type": "opponent_statement_event"}\n')
+    assert not is_transcript_db(jsonl_path)
+
+
+def test_metadata_round_trips_and_defaults_to_empty(tmp_path):
+    async def scenario():
+        path = str(tmp_path / "debate.db")
+        transcript_store = await TranscriptStore.open(path)
+        empty = await transcript_store.read_metadata()
+        await transcript_store.write_metadata({"debate_theme": "Élections", "language": "French"})
+        await transcript_store.close()
+        transcript_store = await TranscriptStore.open_read_only(path)
+        metadata = await transcript_store.read_metadata()
+        await transcript_store.close()
+        return empty, metadata
+
+    assert asyncio.run(scenario()) == ({}, {"debate_theme": "Élections", "language": "French"})
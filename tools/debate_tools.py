@@ -33,8 +33,9 @@ async def track_turn_func(ctx: Context, speaker_name: str) -> str:
 
 async def check_debate_status_func(ctx: Context) -> str:
     """
-    Checks if the debate should end based on total_rounds per side.
-    Returns a directive string for the MediatorAgent.
+    Checks if the debate should end based on total_rounds per side,
+    or earlier if the statements stopped bringing new arguments.
+    Records the stop reason in the state and returns a directive string for the MediatorAgent.
     """
     current_workflow_state = await ctx.get("state") # type: ignore
     total_rounds = current_workflow_state.get("total_rounds", 1) 
@@ -55,6 +56,19 @@ async def check_debate_status_func(ctx: Context) -> str:
     # This means track_turn_tool has been called for their (total_rounds + 1)th turn,
     # implying their (total_rounds)th statement has already been completed in their previous turn.
     if opponent_a_turns > total_rounds or opponent_b_turns > total_rounds:
+        current_workflow_state["stop_reason"] = "rounds_completed"
+        await ctx.set("state", current_workflow_state)
+        return "ACTION: HANDOFF_TO_JUDGE_AGENT"
+
+    # Adaptive early stop: the last `patience` statements each scored below the novelty threshold.
+    novelty_cfg = current_workflow_state.get("novelty_config", {})
+    novelty_patience = novelty_cfg.get("patience", 0)
+    low_novelty_streak = current_workflow_state.get("low_novelty_streak", 0)
+    if novelty_cfg.get("threshold", 0) > 0 and novelty_patience > 0 and low_novelty_streak >= novelty_patience:
+        current_workflow_state["stop_reason"] = (
+            f"low_novelty: {low_novelty_streak} consecutive statements below {novelty_cfg['threshold']}"
+        )
+        await ctx.set("state", current_workflow_state)
         return "ACTION: HANDOFF_TO_JUDGE_AGENT"
     
     # Otherwise, the debate continues, handoff to the designated speaker.
@@ -64,7 +78,7 @@ async def check_debate_status_func(ctx: Context) -> str:
 check_debate_status_tool = FunctionTool.from_defaults(
     fn=check_debate_status_func,
     name="check_debate_status_tool",
-    description="Checks if debate rounds are complete to end or continue."
+    description="Checks if debate rounds are complete or arguments became repetitive, to end or continue."
 )
 track_turn_tool = FunctionTool.from_defaults(
     fn=track_turn_func,
@@ -4,15 +4,43 @@ from llama_index.core.workflow import Context, StopEvent
 from llama_index.core.tools import FunctionTool
 
 from events import OpponentStatementEvent, IntroductionCompleteEvent, JudgmentDeliveredEvent, MediatorAnnouncementEvent
+from utils.novelty import update_novelty_state
+from utils.transcript_store import get_transcript_store
 from utils.tts_utils import get_tts_params_from_state, speak_text
 
+
+async def store_and_speak(
+    ctx: Context, agent_name: str, transcript_text: str, speech_text: str, event, tts_model: str, tts_voice, debate_turn=None
+):
+    """
+    Appends the event to the transcript store, if one is configured, then speaks it.
+    The spoken audio is kept in the store alongside the event.
+    """
+    transcript_store = get_transcript_store(await ctx.get("state")) # type: ignore
+    if transcript_store is None:
+        await speak_text(text_to_speak=speech_text, model=tts_model, voice=tts_voice)
+        return
+
+    seq = await transcript_store.append_event(agent_name, transcript_text, event, debate_turn=debate_turn)
+
+    async def keep_audio(audio_path, response_format):
+        await transcript_store.append_audio(seq, agent_name, audio_path, response_format)
+
+    await speak_text(text_to_speak=speech_text, model=tts_model, voice=tts_voice, on_audio=keep_audio)
+
+
 async def record_statement_tool_func(ctx: Context, agent_name: str, statement: str) -> str:
     """Records the speaker's statement to a custom event stream."""
     tts_model, tts_voice = await get_tts_params_from_state(ctx, agent_name)
     statement_event = OpponentStatementEvent(speaker_name=agent_name, statement=statement)
 
+    current_workflow_state = await ctx.get("state") # type: ignore
+    update_novelty_state(current_workflow_state, agent_name, statement)
+    await ctx.set("state", current_workflow_state)
+    debate_turn = current_workflow_state.get(f"{agent_name}_turns")
+
     ctx.write_event_to_stream(statement_event)
-    await speak_text(text_to_speak=statement, model=tts_model, voice=tts_voice)
+    await store_and_speak(ctx, agent_name, statement, statement, statement_event, tts_model, tts_voice, debate_turn=debate_turn)
     return f"Statement from {agent_name} recorded successfully and spoken."
 
 
@@ -21,7 +49,7 @@ async def record_introduction_tool_func(ctx: Context, agent_name: str, introduct
     tts_model, tts_voice = await get_tts_params_from_state(ctx, agent_name)
     intro_event = IntroductionCompleteEvent(agent_name=agent_name, introduction_message=introduction_message)
     ctx.write_event_to_stream(intro_event)
-    await speak_text(text_to_speak=introduction_message, model=tts_model, voice=tts_voice)
+    await store_and_speak(ctx, agent_name, introduction_message, introduction_message, intro_event, tts_model, tts_voice)
     return f"Introduction from {agent_name} recorded successfully and spoken."
 
 
@@ -31,7 +59,7 @@ async def record_judgment_tool_func(ctx: Context, agent_name: str, judgment_text
     judgment_event = JudgmentDeliveredEvent(judge_name=agent_name, judgment_text=judgment_text, winner=declared_winner)
     tts_model, tts_voice = await get_tts_params_from_state(ctx, agent_name)
     ctx.write_event_to_stream(judgment_event)
-    await speak_text(text_to_speak=full_judgment_speech, model=tts_model, voice=tts_voice)
+    await store_and_speak(ctx, agent_name, judgment_text, full_judgment_speech, judgment_event, tts_model, tts_voice)
     ctx.write_event_to_stream(StopEvent(result="Debate is over!"))
 
 
@@ -41,7 +69,7 @@ async def record_mediator_announcement_tool_func(ctx: Context, agent_name: str,
     announcement_event = MediatorAnnouncementEvent(agent_name=agent_name, announcement_text=announcement_text)
 
     ctx.write_event_to_stream(announcement_event)
-    await speak_text(text_to_speak=announcement_text, model=tts_model, voice=tts_voice)
+    await store_and_speak(ctx, agent_name, announcement_text, announcement_text, announcement_event, tts_model, tts_voice)
     return f"Announcement from {agent_name} recorded successfully and spoken: '{announcement_text}'"
 
 
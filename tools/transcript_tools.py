@@ -0,0 +1,39 @@
+"""Tools for reading the opponents' recorded statements back from the transcript store."""
+
+from typing import Optional
+
+from llama_index.core.workflow import Context
+from llama_index.core.tools import FunctionTool
+
+from utils.transcript_store import get_transcript_store
+
+
+async def read_transcript_tool_func(
+    ctx: Context,
+    speaker_name: Optional[str] = None,
+    from_turn: Optional[int] = None,
+    to_turn: Optional[int] = None,
+) -> str:
+    """
+    Reads the opponents' recorded statements in the order they were made.
+    Optionally filters by speaker name and by an inclusive range of that speaker's turn numbers,
+    as counted by track_turn_tool.
+    """
+    transcript_store = get_transcript_store(await ctx.get("state")) # type: ignore
+    if transcript_store is None:
+        return "No transcript store is configured for this debate."
+
+    lines = [
+        f"[Turn {row['debate_turn']}] {row['speaker']}: {row['text']}"
+        async for row in transcript_store.iter_events(
+            speaker=speaker_name, event_type="opponent_statement_event", from_turn=from_turn, to_turn=to_turn
+        )
+    ]
+    return "\n".join(lines) if lines else "No recorded statements match the request."
+
+
+read_transcript_tool = FunctionTool.from_defaults(
+    fn=read_transcript_tool_func,
+    name="read_transcript_tool",
+    description="Reads the opponents' recorded statements, optionally filtered by speaker and by that speaker's turn numbers."
+)
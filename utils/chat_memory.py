@@ -0,0 +1,53 @@
+"""Chat memory that keeps the AgentWorkflow history bounded in long debates."""
+
+from typing import List
+
+from llama_index.core.llms import ChatMessage, MessageRole
+from llama_index.core.memory import ChatMemoryBuffer
+
+
+class RecentChatMemoryBuffer(ChatMemoryBuffer):
+    """
+    A ChatMemoryBuffer that only keeps what fits in `token_limit`: the opening user message
+    plus the most recent messages. ChatMemoryBuffer trims what it hands to the LLM but keeps
+    every message; this one drops the older ones, so memory stays flat however long the debate.
+    Meant for debates with a transcript store, where agents re-read older statements through read_transcript_tool.
+    """
+
+    def put(self, message: ChatMessage) -> None:
+        super().put(message)
+        self._drop_old_messages()
+
+    async def aput(self, message: ChatMessage) -> None:
+        await super().aput(message)
+        self._drop_old_messages()
+
+    def _token_count_for_messages(self, messages: List[ChatMessage]) -> int:
+        """Counts tool call arguments too: debaters pass their statements to record_statement_tool as one."""
+        if not messages:
+            return 0
+        msg_str = " ".join(f"{m.content or ''} {m.additional_kwargs.get('tool_calls', '')}" for m in messages)
+        return len(self.tokenizer_fn(msg_str))
+
+    def _drop_old_messages(self) -> None:
+        messages = self.get_all()
+        if len(messages) < 2 or self._token_count_for_messages(messages) <= self.token_limit:
+            return
+
+        opening, recent = messages[:1], messages[1:]
+        budget = self.token_limit - self._token_count_for_messages(opening)
+        start = len(recent)
+        while start > 0:
+            message_tokens = self._token_count_for_messages([recent[start - 1]])
+            if message_tokens > budget:
+                break
+            budget -= message_tokens
+            start -= 1
+        # Per-message counts can differ slightly from the joined count that `get` checks.
+        while start < len(recent) and self._token_count_for_messages(opening + recent[start:]) > self.token_limit:
+            start += 1
+        # A tool result cannot open the window once the tool call it answers was dropped.
+        while start < len(recent) and recent[start].role == MessageRole.TOOL:
+            start += 1
+
+        self.set(opening + recent[start:])
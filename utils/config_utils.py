@@ -0,0 +1,16 @@
+"""Utilities for loading the YAML configuration files."""
+
+from pathlib import Path
+
+import yaml
+
+CONFIG_PATH = Path(__file__).parent.parent / "config"
+
+
+def load_config(file_name: str) -> dict:
+    """Loads a YAML configuration file from the config directory, falling back to the given path."""
+    config_file = CONFIG_PATH / file_name
+    if not config_file.exists():
+        config_file = Path(file_name)
+    with open(config_file, 'r') as f:
+        return yaml.safe_load(f)
@@ -0,0 +1,81 @@
+"""Event bus sinks: console renderer, JSONL event log writer and metrics collector."""
+
+import asyncio
+import json
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from event_bus import EventSubscription
+from events import OpponentStatementEvent, IntroductionCompleteEvent, JudgmentDeliveredEvent, MediatorAnnouncementEvent
+from utils.ansi_colors import RESET, RED, YELLOW, BLUE, MAGENTA, CYAN
+
+
+def render_event(event, opponent_a_name: str, debate_theme: str) -> None:
+    """Prints a single debate event to the console."""
+    if isinstance(event, IntroductionCompleteEvent):
+        print(f"\n{MAGENTA}📜 Introduction ({event.agent_name} on '{debate_theme}'):{RESET}\n  {event.introduction_message}")
+    elif isinstance(event, OpponentStatementEvent):
+        color = BLUE if event.speaker_name == opponent_a_name else RED
+        print(f"\n{color}💬 {event.speaker_name}:{RESET}\n  {event.statement}") # type: ignore
+    elif isinstance(event, MediatorAnnouncementEvent):
+        print(f"\n{CYAN}🗣️  {event.agent_name} (Mediator):{RESET}\n  {event.announcement_text}")
+    elif isinstance(event, JudgmentDeliveredEvent):
+        print(f"\n{YELLOW}⚖️ Judge ({event.judge_name}):{RESET}\n  {event.judgment_text}")
+        print(f"{YELLOW}🏆 Declared Winner:{RESET} {event.winner}")
+        print()
+
+
+def console_sink(opponent_a_name: str, debate_theme: str):
+    """Creates a sink that renders debate events to the console."""
+    async def _sink(subscription: EventSubscription) -> None:
+        async for _, event in subscription:
+            render_event(event, opponent_a_name, debate_theme)
+    return _sink
+
+
+def jsonl_sink(path: Path, metadata: Optional[dict] = None, batch_size: int = 64):
+    """
+    Creates a sink that appends every debate event (events defined in `events.py`) to a JSONL file.
+    Each line holds the event fields plus `elapsed`, the seconds since the first recorded event.
+    If given, `metadata` (debate settings such as theme and language) is written first as a
+    `{"debate_metadata": {...}}` header line.
+    Lines are written in batches from a worker thread, so file I/O never runs on the event loop
+    shared with the workflow. A batch is written when it is full or no more events are pending.
+    """
+    def _write_lines(f, lines: list[str]) -> None:
+        f.writelines(lines)
+        f.flush()
+
+    async def _sink(subscription: EventSubscription) -> None:
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        f = await asyncio.to_thread(open, path, "w", encoding="utf-8")
+        try:
+            first_published_at = None
+            lines: list[str] = []
+            if metadata:
+                lines.append(json.dumps({"debate_metadata": metadata}, ensure_ascii=False) + "\n")
+            async for published_at, event in subscription:
+                if hasattr(event, "event_type"):
+                    if first_published_at is None:
+                        first_published_at = published_at
+                    record = {"elapsed": round(published_at - first_published_at, 3), "recorded_at": time.time()}
+                    record.update(event.model_dump())
+                    lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+                if lines and (len(lines) >= batch_size or not subscription.pending):
+                    await asyncio.to_thread(_write_lines, f, lines)
+                    lines = []
+            if lines:
+                await asyncio.to_thread(_write_lines, f, lines)
+        finally:
+            await asyncio.to_thread(f.close)
+    return _sink
+
+
+def metrics_sink(event_counts: Counter):
+    """Creates a sink that counts received events by type into `event_counts`."""
+    async def _sink(subscription: EventSubscription) -> None:
+        async for _, event in subscription:
+            event_counts[getattr(event, "event_type", type(event).__name__)] += 1
+    return _sink
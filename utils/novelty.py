@@ -0,0 +1,100 @@
+"""Utilities for scoring how much new material a debate statement brings."""
+
+import base64
+import re
+import zlib
+from typing import Optional
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# 2**20 bits (128 KB) keep false positives around 1% for 100k shingles, i.e. ~200 rounds of long statements.
+DEFAULT_BLOOM_BITS = 2 ** 20
+_BLOOM_HASH_COUNT = 4
+
+
+def statement_shingles(text: str, ngram_size: int = 3) -> set[int]:
+    """
+    Splits a statement into hashed word n-grams (shingles).
+    Hashes use crc32 so they are stable across processes.
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+    if not words:
+        return set()
+    if len(words) < ngram_size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))}
+    return {
+        zlib.crc32(" ".join(words[i:i + ngram_size]).encode("utf-8"))
+        for i in range(len(words) - ngram_size + 1)
+    }
+
+
+def _bloom_positions(shingle: int, bloom_bits: int) -> list[int]:
+    """Returns the bit positions of a shingle in the bloom filter (double hashing on the crc32 value)."""
+    step = zlib.adler32(shingle.to_bytes(4, "little")) | 1
+    return [(shingle + i * step) % bloom_bits for i in range(_BLOOM_HASH_COUNT)]
+
+
+def load_bloom(state: dict) -> bytearray:
+    """Decodes the seen-shingles bloom filter from the workflow state, creating an empty one if needed."""
+    bloom_bits = state.get("novelty_config", {}).get("bloom_bits", DEFAULT_BLOOM_BITS)
+    encoded_bloom = state.get("novelty_bloom")
+    if not encoded_bloom:
+        return bytearray(bloom_bits // 8)
+    return bytearray(base64.b64decode(encoded_bloom))
+
+
+def novelty_score(shingles: set[int], bloom: bytearray) -> float:
+    """
+    Returns the share of a statement's shingles not present in earlier statements.
+    1.0 means entirely new material, 0.0 means everything was already said.
+    Bloom filter false positives can only make a statement look slightly less novel.
+    """
+    if not shingles:
+        return 0.0
+    bloom_bits = len(bloom) * 8
+    new_shingles = sum(
+        1 for shingle in shingles
+        if not all(bloom[position >> 3] & (1 << (position & 7)) for position in _bloom_positions(shingle, bloom_bits))
+    )
+    return new_shingles / len(shingles)
+
+
+def add_to_bloom(shingles: set[int], bloom: bytearray) -> None:
+    """Sets the bits of every shingle in the bloom filter."""
+    bloom_bits = len(bloom) * 8
+    for shingle in shingles:
+        for position in _bloom_positions(shingle, bloom_bits):
+            bloom[position >> 3] |= 1 << (position & 7)
+
+
+def record_novelty_score(state: dict, speaker_name: str, score: float) -> None:
+    """
+    Appends the statement's score to the workflow state and tracks the
+    consecutive low-novelty streak used by the debate status check.
+    """
+    threshold = state.get("novelty_config", {}).get("threshold", 0.0)
+    state.setdefault("novelty_scores", []).append({"speaker": speaker_name, "score": round(score, 3)})
+    if threshold > 0 and score < threshold:
+        state["low_novelty_streak"] = state.get("low_novelty_streak", 0) + 1
+    else:
+        state["low_novelty_streak"] = 0
+
+
+def update_novelty_state(state: dict, speaker_name: str, statement: str) -> Optional[float]:
+    """
+    Scores the statement against everything said before, then folds its shingles
+    into the fixed-size bloom filter kept in the workflow state.
+    Empty statements (e.g. a blank LLM output) are skipped and do not count towards the streak.
+    """
+    ngram_size = state.get("novelty_config", {}).get("ngram_size", 3)
+    shingles = statement_shingles(statement, ngram_size)
+    if not shingles:
+        return None
+
+    bloom = load_bloom(state)
+    score = novelty_score(shingles, bloom)
+    add_to_bloom(shingles, bloom)
+
+    state["novelty_bloom"] = base64.b64encode(bloom).decode("ascii")
+    record_novelty_score(state, speaker_name, score)
+    return score
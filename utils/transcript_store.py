@@ -0,0 +1,179 @@
+"""Append-only SQLite storage for debate transcripts and audio, indexed by debate turn and speaker."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+import aiosqlite
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    debate_turn INTEGER,
+    speaker TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    text TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_speaker_turn ON events (speaker, debate_turn);
+CREATE TABLE IF NOT EXISTS audio (
+    seq INTEGER PRIMARY KEY REFERENCES events (seq),
+    speaker TEXT NOT NULL,
+    format TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+
+# Stores opened in this process, keyed by database path, so tools can find them from the workflow state.
+_open_stores: dict[str, "TranscriptStore"] = {}
+
+
+class TranscriptStore:
+    """
+    Persists every recorded debate event and the spoken TTS audio to an append-only SQLite file.
+    Each event gets `seq`, its position among all recorded events. Opponent statements also get
+    `debate_turn`, the speaker's turn number as counted by `track_turn_tool`; other events
+    (introduction, mediator announcements, judgment) leave it empty.
+    """
+
+    def __init__(self, path: str, connection: aiosqlite.Connection, keep_audio: bool, read_only: bool = False):
+        self.path = path
+        self.keep_audio = keep_audio
+        self.read_only = read_only
+        self._connection = connection
+
+    @classmethod
+    async def open(cls, path: str, keep_audio: bool = True) -> "TranscriptStore":
+        """Opens (or creates) the database at `path` and registers it for `get_transcript_store`."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = await aiosqlite.connect(path)
+        connection.row_factory = aiosqlite.Row
+        await connection.execute("PRAGMA journal_mode=WAL")
+        await connection.executescript(_SCHEMA)
+        await connection.commit()
+        store = cls(path=path, connection=connection, keep_audio=keep_audio)
+        _open_stores[path] = store
+        return store
+
+    @classmethod
+    async def open_read_only(cls, path: str) -> "TranscriptStore":
+        """Opens an existing database for reading only, without changing its journal mode or schema."""
+        connection = await aiosqlite.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+        connection.row_factory = aiosqlite.Row
+        return cls(path=path, connection=connection, keep_audio=False, read_only=True)
+
+    async def close(self) -> None:
+        """
+        Closes the database connection. A writable store leaves WAL mode first,
+        so the finished database is a single self-contained file.
+        """
+        if _open_stores.get(self.path) is self:
+            _open_stores.pop(self.path)
+        if not self.read_only:
+            await self._connection.execute("PRAGMA journal_mode=DELETE")
+        await self._connection.close()
+
+    async def write_metadata(self, metadata: dict) -> None:
+        """Records debate settings (e.g. theme and language) so a replay can default to them."""
+        await self._connection.executemany(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in metadata.items()],
+        )
+        await self._connection.commit()
+
+    async def read_metadata(self) -> dict:
+        """Returns the recorded debate settings; empty for databases recorded without them."""
+        try:
+            async with self._connection.execute("SELECT key, value FROM metadata") as cursor:
+                return {row["key"]: json.loads(row["value"]) async for row in cursor}
+        except aiosqlite.OperationalError:
+            return {}
+
+    async def append_event(self, speaker: str, text: str, event: Any, debate_turn: Optional[int] = None) -> int:
+        """Appends a debate event (any event from `events.py`) and returns its `seq`."""
+        cursor = await self._connection.execute(
+            "INSERT INTO events (debate_turn, speaker, event_type, text, payload, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (debate_turn, speaker, event.event_type, text, json.dumps(event.model_dump(), ensure_ascii=False), time.time()),
+        )
+        await self._connection.commit()
+        return cursor.lastrowid # type: ignore
+
+    async def append_audio(self, seq: int, speaker: str, audio_path: Path, response_format: str) -> None:
+        """Stores the audio spoken for an event. Does nothing if the store does not keep audio."""
+        if not self.keep_audio:
+            return
+        await self._connection.execute(
+            "INSERT OR REPLACE INTO audio (seq, speaker, format, data) VALUES (?, ?, ?, ?)",
+            (seq, speaker, response_format, audio_path.read_bytes()),
+        )
+        await self._connection.commit()
+
+    async def read_audio(self, seq: int) -> Optional[tuple[str, bytes]]:
+        """Returns the (format, audio bytes) spoken for an event, if any."""
+        async with self._connection.execute("SELECT format, data FROM audio WHERE seq = ?", (seq,)) as cursor:
+            row = await cursor.fetchone()
+        return (row["format"], row["data"]) if row else None
+
+    async def iter_events(
+        self,
+        speaker: Optional[str] = None,
+        event_type: Optional[str] = None,
+        from_turn: Optional[int] = None,
+        to_turn: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Streams recorded events in recording order, optionally filtered by speaker, event type
+        and an inclusive `debate_turn` range (turn filters only match opponent statements).
+        Yields dicts with seq, debate_turn, speaker, event_type, text, payload (the event fields) and created_at.
+        """
+        conditions, params = [], []
+        if speaker is not None:
+            conditions.append("speaker = ?")
+            params.append(speaker)
+        if event_type is not None:
+            conditions.append("event_type = ?")
+            params.append(event_type)
+        if from_turn is not None:
+            conditions.append("debate_turn >= ?")
+            params.append(from_turn)
+        if to_turn is not None:
+            conditions.append("debate_turn <= ?")
+            params.append(to_turn)
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        async with self._connection.execute(
+            f"SELECT seq, debate_turn, speaker, event_type, text, payload, created_at FROM events {where_clause} ORDER BY seq",
+            params,
+        ) as cursor:
+            async for row in cursor:
+                yield {
+                    "seq": row["seq"],
+                    "debate_turn": row["debate_turn"],
+                    "speaker": row["speaker"],
+                    "event_type": row["event_type"],
+                    "text": row["text"],
+                    "payload": json.loads(row["payload"]),
+                    "created_at": row["created_at"],
+                }
+
+
+def is_transcript_db(path: Path) -> bool:
+    """Tells a SQLite database apart from other files (e.g. a JSONL event log) by its header."""
+    with open(path, 'rb') as f:
+        return f.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+
+
+def get_transcript_store(state: dict) -> Optional[TranscriptStore]:
+    """Returns the transcript store named by the workflow state's `transcript_db`, if one is open."""
+    transcript_db = state.get("transcript_db")
+    if not transcript_db:
+        return None
+    return _open_stores.get(transcript_db)
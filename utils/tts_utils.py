@@ -4,7 +4,7 @@ import asyncio
 import os
 import subprocess
 import tempfile
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -21,11 +21,16 @@ if _openai_api_key:
 else:
     print("Info: OPENAI_API_KEY not set. TTS functionality will be disabled.")
 
-async def get_tts_params_from_state(ctx: Context, agent_name: str) -> tuple[str, str]:
-    """Retrieves TTS model and agent-specific voice from workflow state."""
+async def get_tts_params_from_state(ctx: Context, agent_name: str) -> tuple[str, Optional[str]]:
+    """
+    Retrieves TTS model and agent-specific voice from workflow state.
+    The voice is None when TTS is disabled in the state's tts_config.
+    """
     current_workflow_state = await ctx.get("state") # type: ignore
     tts_config = current_workflow_state.get("tts_config", {})
     tts_model = tts_config.get("model", "gpt-4o-mini-tts")  # Fallback model
+    if not tts_config.get("enabled", True):
+        return tts_model, None
     agent_voices = tts_config.get("voices", {})
     tts_voice = agent_voices.get(agent_name, "alloy")  # Fallback voice
     return tts_model, tts_voice
@@ -33,11 +38,15 @@ async def get_tts_params_from_state(ctx: Context, agent_name: str) -> tuple[str,
 async def speak_text(
     text_to_speak: str,
     model: str,
-    voice: str,
-    response_format: str = "mp3"
+    voice: Optional[str],
+    response_format: str = "mp3",
+    on_audio: Optional[Callable[[Path, str], Awaitable[None]]] = None,
 ):
-    """Helper function to speak text using OpenAI TTS."""
-    if not tts_client or not text_to_speak.strip():
+    """
+    Helper function to speak text using OpenAI TTS. Does nothing if no voice is given.
+    `on_audio` is awaited with the audio file and its format before playback, e.g. to keep a copy.
+    """
+    if not tts_client or not voice or not text_to_speak.strip():
         return
 
     temp_file_path_obj: Optional[Path] = None
@@ -57,6 +66,8 @@ async def speak_text(
             await response.stream_to_file(temp_file_path_obj) # type: ignore
 
         if temp_file_path_obj and temp_file_path_obj.exists() and temp_file_path_obj.stat().st_size > 0:
+            if on_audio:
+                await on_audio(temp_file_path_obj, response_format)
             playback_command = ["ffplay", "-autoexit", "-nodisp", str(temp_file_path_obj)]
             try:
                 await asyncio.to_thread(